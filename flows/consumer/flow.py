@@ -22,8 +22,9 @@ class ConsumerFlow(ProjectFlow):
     @card(type="blank")
     @step
     def start(self):
-        """Retrieve the data asset."""
-        print("Retrieving data asset...")
+        """Retrieve the data and model assets, then process them."""
+        print("Retrieving data and model assets...")
+        card_md = []
 
         try:
             self.data = self.prj.get_data("sample_data")
@@ -31,25 +32,18 @@ class ConsumerFlow(ProjectFlow):
             print(f"  Data: {self.data}")
             self.data_success = True
 
-            current.card.append(MD("## Data Asset Retrieved"))
-            current.card.append(MD(f"```json\n{json.dumps(self.data, indent=2)}\n```"))
+            card_md.append("## Data Asset Retrieved")
+            card_md.append(f"```json\n{json.dumps(self.data, indent=2)}\n```")
 
         except Exception as e:
-            print(f"get_data('sample_data') failed: {e}")
+            err = str(e)
+            print(f"get_data('sample_data') failed: {err}")
             self.data = None
             self.data_success = False
-            self.data_error = str(e)
+            self.data_error = err
 
-            current.card.append(MD("## Data Asset: Failed"))
-            current.card.append(MD(f"**Error:** {e}"))
-
-        self.next(self.get_model)
-
-    @card(type="blank")
-    @step
-    def get_model(self):
-        """Retrieve the model asset."""
-        print("Retrieving model asset...")
+            card_md.append("## Data Asset: Failed")
+            card_md.append(f"**Error:** {err}")
 
         try:
             self.model = self.prj.get_model("sample_model")
@@ -57,23 +51,21 @@ class ConsumerFlow(ProjectFlow):
             print(f"  Model: {self.model}")
             self.model_success = True
 
-            current.card.append(MD("## Model Asset Retrieved"))
-            current.card.append(MD(f"```json\n{json.dumps(self.model, indent=2)}\n```"))
+            card_md.append("## Model Asset Retrieved")
+            card_md.append(f"```json\n{json.dumps(self.model, indent=2)}\n```")
 
         except Exception as e:
-            print(f"get_model('sample_model') failed: {e}")
+            err = str(e)
+            print(f"get_model('sample_model') failed: {err}")
             self.model = None
             self.model_success = False
-            self.model_error = str(e)
+            self.model_error = err
 
-            current.card.append(MD("## Model Asset: Failed"))
-            current.card.append(MD(f"**Error:** {e}"))
+            card_md.append("## Model Asset: Failed")
+            card_md.append(f"**Error:** {err}")
 
-        self.next(self.process)
+        current.card.append(MD("\n\n".join(card_md)))
 
-    @step
-    def process(self):
-        """Process the retrieved assets."""
         print("Processing retrieved assets...")
 
         if self.data_success:
@@ -90,18 +82,20 @@ class ConsumerFlow(ProjectFlow):
     @step
     def end(self):
         """Summary."""
-        current.card.append(MD("## Summary"))
+        card_md = ["## Summary"]
 
         all_passed = self.data_success and self.model_success
 
         if all_passed:
-            current.card.append(MD("All asset retrievals succeeded."))
+            card_md.append("All asset retrievals succeeded.")
         else:
-            current.card.append(MD("Some asset retrievals failed:"))
+            card_md.append("Some asset retrievals failed:")
             if not self.data_success:
-                current.card.append(MD(f"- Data: {self.data_error}"))
+                card_md.append(f"- Data: {self.data_error}")
             if not self.model_success:
-                current.card.append(MD(f"- Model: {self.model_error}"))
+                card_md.append(f"- Model: {self.model_error}")
+
+        current.card.append(MD("\n\n".join(card_md)))
 
 
 if __name__ == "__main__":
@@ -23,7 +23,9 @@ class ProducerFlow(ProjectFlow):
     @card(type="blank")
     @step
     def start(self):
-        """Register a data asset."""
+        """Register a data asset and a model asset."""
+        pathspec = current.pathspec
+
         # Create data as an artifact
         self.sample_data = {
             "message": "Hello from ProducerFlow",
@@ -39,20 +41,10 @@ class ProducerFlow(ProjectFlow):
             annotations={
                 "row_count": "5",
                 "source": "producer_flow",
-                "pathspec": current.pathspec
+                "pathspec": pathspec
             }
         )
 
-        current.card.append(MD("## Data Asset Registered"))
-        current.card.append(MD(f"**Asset ID:** sample_data"))
-        current.card.append(MD(f"```json\n{json.dumps(self.sample_data, indent=2)}\n```"))
-
-        self.next(self.register_model)
-
-    @card(type="blank")
-    @step
-    def register_model(self):
-        """Register a model asset."""
         # Create a mock model as an artifact
         self.sample_model = {
             "type": "mock_classifier",
@@ -72,14 +64,22 @@ class ProducerFlow(ProjectFlow):
             annotations={
                 "accuracy": "0.95",
                 "framework": "mock",
-                "pathspec": current.pathspec
+                "pathspec": pathspec
             }
         )
 
-        current.card.append(MD("## Model Asset Registered"))
-        current.card.append(MD(f"**Asset ID:** sample_model"))
-        current.card.append(MD(f"```json\n{json.dumps(self.sample_model, indent=2)}\n```"))
-
+        card_md = [
+            "## Data Asset Registered",
+            f"**Asset ID:** sample_data",
+            f"```json\n{json.dumps(self.sample_data, indent=2)}\n```",
+            "## Model Asset Registered",
+            f"**Asset ID:** sample_model",
+            f"```json\n{json.dumps(self.sample_model, indent=2)}\n```",
+        ]
+        current.card.append(MD("\n\n".join(card_md)))
+
+        # Artifacts are persisted when this step ends, so retrieval has to
+        # be verified in a later step.
         self.next(self.verify)
 
     @step
@@ -115,21 +115,23 @@ class ProducerFlow(ProjectFlow):
     @step
     def end(self):
         """Summary of asset operations."""
-        current.card.append(MD("## Results"))
+        card_md = ["## Results"]
 
         if self.data_retrieval_success:
-            current.card.append(MD("### Data Asset: Success"))
-            current.card.append(MD(f"```json\n{json.dumps(self.retrieved_data, indent=2)}\n```"))
+            card_md.append("### Data Asset: Success")
+            card_md.append(f"```json\n{json.dumps(self.retrieved_data, indent=2)}\n```")
         else:
-            current.card.append(MD("### Data Asset: Failed"))
-            current.card.append(MD(f"Error: `{self.data_retrieval_error}`"))
+            card_md.append("### Data Asset: Failed")
+            card_md.append(f"Error: `{self.data_retrieval_error}`")
 
         if self.model_retrieval_success:
-            current.card.append(MD("### Model Asset: Success"))
-            current.card.append(MD(f"```json\n{json.dumps(self.retrieved_model, indent=2)}\n```"))
+            card_md.append("### Model Asset: Success")
+            card_md.append(f"```json\n{json.dumps(self.retrieved_model, indent=2)}\n```")
         else:
-            current.card.append(MD("### Model Asset: Failed"))
-            current.card.append(MD(f"Error: `{self.model_retrieval_error}`"))
+            card_md.append("### Model Asset: Failed")
+            card_md.append(f"Error: `{self.model_retrieval_error}`")
+
+        current.card.append(MD("\n\n".join(card_md)))
 
 
 if __name__ == "__main__":